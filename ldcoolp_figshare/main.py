@@ -1,14 +1,119 @@
-from typing import Tuple, Optional, Union
-
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor
+import re
+import time
+from typing import Tuple, Optional, Union, List, Callable, Awaitable, \
+    AsyncIterator
+
+import httpx
+import orjson
+import requests
 from requests import Response
-from requests.exceptions import HTTPError
+from requests.adapters import HTTPAdapter
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 
 from logging import Logger
 from redata.commons.logger import log_stdout
-from redata.commons.issue_request import redata_request
+
+
+def _to_dataframe(records: list) -> pd.DataFrame:
+    """
+    Construct a DataFrame from a list of records through a ``pyarrow.Table``,
+    which infers column types in C. The schema is the union of keys across
+    all records. Arrow-backed columns are used if supported by pandas
+
+    :param records: JSON content, a list of dictionaries
+
+    :return: Relational database of ``records``
+    """
+
+    try:
+        table = pa.Table.from_struct_array(pa.array(records))
+    except (pa.ArrowException, TypeError, ValueError):
+        # No records or records with inconsistent types across rows
+        return pd.DataFrame(records)
+
+    if hasattr(pd, 'ArrowDtype'):
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return table.to_pandas()
+
+
+class _BatchLoader:
+    """
+    DataLoader-style batching of requests keyed by account ID
+
+    Calls to :meth:`load` are coalesced and de-duplicated by key, then
+    dispatched together in a single ``asyncio.gather`` once
+    ``batch_interval_ms`` has elapsed or ``max_batch_size`` keys are pending
+
+    :param fetch: Coroutine function that retrieves a single key
+    :param batch_interval_ms: Maximum wait before dispatching a batch
+    :param max_batch_size: Maximum number of keys in a batch
+    """
+
+    def __init__(self, fetch: Callable[[int], Awaitable],
+                 batch_interval_ms: int = 10, max_batch_size: int = 32):
+        self.fetch = fetch
+        self.batch_interval = batch_interval_ms / 1000
+        self.max_batch_size = max_batch_size
+
+        self._futures = {}
+        self._pending = {}
+        self._handle = None
+        self._tasks = set()
+
+    def load(self, key: int) -> asyncio.Future:
+        """Schedule ``key`` for the next batch
+
+        :param key: Key to retrieve (e.g., account ID)
+
+        :return: Future resolved with the result of ``fetch(key)``
+        """
+
+        if key in self._futures:
+            return self._futures[key]
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        self._pending[key] = future
+
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._handle is None:
+            self._handle = loop.call_later(self.batch_interval,
+                                           self._dispatch)
+        return future
+
+    def _dispatch(self):
+        """Drain pending keys and resolve them in a background task"""
+
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._resolve(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: dict):
+        """Retrieve all keys in ``batch`` and resolve their futures"""
+
+        results = await asyncio.gather(*[self.fetch(key) for key in batch],
+                                       return_exceptions=True)
+        for future, result in zip(batch.values(), results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
 
 class FigshareInstituteAdmin:
@@ -22,19 +127,37 @@ class FigshareInstituteAdmin:
     :param stage: Flag to either use Figshare stage or production API. Default: production
     :param admin_filter: List of filters to remove admin accounts from user list
     :param log: Logger object for stdout and file logging. Default: stdout
+    :param cache_ttl: Seconds to re-use cached groups and accounts before
+                      revalidating with Figshare. Default: 300
 
     :ivar token: Figshare OAuth2 authentication token
     :ivar stage: Flag to either use Figshare stage or prod API
     :ivar baseurl: Base URL of Figshare API
     :ivar baseurl_institute: Base URL of Figshare API for institutions
     :ivar headers: HTTP header information
+    :ivar session: Persistent ``requests.Session`` with pooled connections
     :ivar admin_filter: List of filters to remove admin accounts from user list
     :ivar ignore_admin: Flags whether to remove admin accounts from user list
+    :ivar cache_ttl: Seconds to re-use cached groups and accounts
     """
 
+    # Figshare group role IDs
+    ROLE_GROUP = 11
+    ROLE_ADMIN = 2
+    ROLE_REVIEWER = 49
+
+    # Maximum attempts for rate-limited (429) and server error (5xx) responses
+    max_tries = 3
+
+    # Maximum seconds to wait before a retry, regardless of Retry-After
+    max_retry_delay = 60
+
+    # Group roles responses indicating an account should be skipped
+    skip_status = (403, 404, 410)
+
     def __init__(self, token: str, stage: bool = False,
                  admin_filter: list = None,
-                 log: Logger = log_stdout()):
+                 log: Logger = log_stdout(), cache_ttl: float = 300):
 
         self.token = token
         self.stage = stage
@@ -46,17 +169,49 @@ class FigshareInstituteAdmin:
 
         self.baseurl_institute = self.baseurl + "institution/"
 
+        # Endpoints requested for every account in get_account_details
+        self._url_articles_user = self.baseurl + "articles"
+        self._url_projects_user = self.baseurl + "projects"
+        self._url_collections_user = self.baseurl + "collections"
+        self._url_roles = self.baseurl_institute + "roles/"
+        self._url_users = self.baseurl_institute + "users/"
+
         self.headers = {'Content-Type': 'application/json'}
         if self.token:
             self.headers['Authorization'] = f'token {self.token}'
 
+        # Re-use connections to the Figshare API across calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(pool_connections=4,
+                                                   pool_maxsize=32))
+
         self.admin_filter = admin_filter
         if admin_filter is not None:
             self.ignore_admin = True
         else:
             self.ignore_admin = False
+
+        # Combine filters into a single alternation so that emails are
+        # scanned once. Filters with groups (e.g., backreferences) or global
+        # inline flags (e.g., '(?i)') change meaning when combined and are
+        # matched separately
+        self._admin_patterns = []
+        if admin_filter:
+            compiled = [re.compile(ia) for ia in admin_filter]
+            combinable = [p for p in compiled
+                          if p.groups == 0 and p.flags == re.UNICODE]
+            if combinable:
+                self._admin_patterns.append(re.compile(
+                    '|'.join(f'(?:{p.pattern})' for p in combinable)
+                ))
+            self._admin_patterns += [p for p in compiled
+                                     if p not in combinable]
         self.log = log
 
+        self.cache_ttl = cache_ttl
+        self._cache = {}
+
     def endpoint(self, link: str, institute: bool = True) -> str:
         """Concatenate the endpoint to the baseurl for ``requests``
 
@@ -70,6 +225,235 @@ class FigshareInstituteAdmin:
         else:
             return self.baseurl + link
 
+    def _request(self, method: str, url: str, params: dict = None,
+                 headers: dict = None, process: bool = True) \
+            -> Union[dict, list, Response]:
+        """Issue an HTTP request through the persistent session
+
+        :param method: HTTP method (e.g., 'GET', 'POST')
+        :param url: URL for HTTPS API
+        :param params: Query parameters for the request
+        :param headers: Additional HTTP headers for this request
+        :param process: Returns JSON content, otherwise the full
+                        ``requests.Response``. Default: True
+
+        :return: JSON content or the full ``requests.Response``
+        """
+
+        for attempt in range(self.max_tries):
+            response = self.session.request(method, url, params=params,
+                                            headers=headers)
+            delay = self._retry_delay(response, attempt, method=method)
+            if delay is None:
+                break
+            time.sleep(delay)
+        response.raise_for_status()
+
+        if process:
+            return orjson.loads(response.content)
+        else:
+            return response
+
+    def _retry_delay(self, response: Union[Response, httpx.Response],
+                     attempt: int, method: str = 'GET') -> Optional[float]:
+        """
+        Determine wait time before retrying a rate-limited (429) or
+        server error (5xx) response. Server errors are only retried for GET
+        requests so that non-idempotent requests (e.g., DOI reservation) are
+        never re-sent
+
+        :param response: HTTP response
+        :param attempt: Zero-based attempt number
+        :param method: HTTP method of the request
+
+        :return: Seconds to wait, or None if the request should not be retried
+        """
+
+        status_code = response.status_code
+        if attempt + 1 >= self.max_tries:
+            return None
+        if status_code != 429 and \
+                (status_code < 500 or method.upper() != 'GET'):
+            return None
+
+        retry_after = response.headers.get('Retry-After')
+        if status_code == 429 and retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = 2 ** attempt + random.random()
+        delay = min(delay, self.max_retry_delay)
+
+        self.log.warning(f"HTTP {status_code} for {response.url}. "
+                         f"Retrying in {delay:.1f}s")
+        return delay
+
+    async def _async_get(self, client: httpx.AsyncClient, url: str,
+                         params: dict = None,
+                         sem: asyncio.Semaphore = None) -> httpx.Response:
+        """Asynchronous GET request with the same retries as ``_request``
+
+        :param client: ``httpx.AsyncClient`` to use
+        :param url: URL for HTTPS API
+        :param params: Query parameters for the request
+        :param sem: Semaphore limiting concurrent requests. It is only held
+                    while a request is in flight, not while waiting to retry
+
+        :return: ``httpx.Response``
+        """
+
+        for attempt in range(self.max_tries):
+            if sem is None:
+                response = await client.get(url, params=params)
+            else:
+                async with sem:
+                    response = await client.get(url, params=params)
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+        return response
+
+    def _cached_request(self, key: str, url: str, params: dict = None,
+                        paginate: bool = False) -> Union[dict, list]:
+        """
+        GET request for slowly-changing data that is cached for ``cache_ttl``
+        seconds. Once expired, the cache is revalidated with ``If-None-Match``
+        and re-used if Figshare responds with HTTP 304
+
+        :param key: Cache key
+        :param url: URL for HTTPS API
+        :param params: Query parameters for the request
+        :param paginate: Retrieve all pages with ``_get_all_pages``.
+                         Paginated content is re-fetched once expired
+                         without ETag revalidation
+
+        :return: JSON content
+        """
+
+        headers = None
+        entry = self._cache.get(key)
+        if entry is not None:
+            timestamp, etag, content = entry
+            if time.monotonic() - timestamp < self.cache_ttl:
+                return content
+            if etag:
+                headers = {'If-None-Match': etag}
+
+        if paginate:
+            content = self._get_all_pages(url, params)
+            self._cache[key] = (time.monotonic(), None, content)
+            return content
+
+        response = self._request('GET', url, params=params, headers=headers,
+                                 process=False)
+        if entry is not None and response.status_code == 304:
+            content = entry[2]
+        else:
+            content = orjson.loads(response.content)
+
+        self._cache[key] = (time.monotonic(), response.headers.get('ETag'),
+                            content)
+        return content
+
+    def clear_cache(self):
+        """Remove cached groups and accounts"""
+        self._cache.clear()
+
+    @staticmethod
+    def _page_params(params: Optional[dict], k: int, page_size: int,
+                     offset: bool) -> dict:
+        """
+        Query parameters for the zero-based page ``k`` of a paginated endpoint
+
+        :param params: Query parameters for the request
+        :param k: Zero-based page number
+        :param page_size: Number of records per page
+        :param offset: Use ``offset``/``limit`` instead of
+                       ``page``/``page_size`` pagination
+
+        :return: Query parameters including pagination
+        """
+
+        page_params = dict(params or {})
+        if offset:
+            page_params.update(offset=k * page_size, limit=page_size)
+        else:
+            page_params.update(page=k + 1, page_size=page_size)
+        return page_params
+
+    async def _paginate(self, url: str, params: dict = None,
+                        page_size: int = 1000, offset: bool = False, *,
+                        client: httpx.AsyncClient,
+                        sem: asyncio.Semaphore = None) \
+            -> AsyncIterator[list]:
+        """
+        Asynchronously iterate over all pages of a paginated endpoint.
+        The next page is requested before the current page is yielded so
+        that retrieval overlaps with processing by the caller
+
+        :param url: URL for HTTPS API
+        :param params: Query parameters for the request
+        :param page_size: Number of records per page. Figshare API is limited
+                          to a maximum of 1000 per page
+        :param offset: Use ``offset``/``limit`` instead of
+                       ``page``/``page_size`` pagination
+        :param client: Open ``httpx.AsyncClient`` to use
+        :param sem: Semaphore limiting concurrent requests
+
+        :return: JSON content of each page
+        """
+
+        def fetch(k: int) -> asyncio.Future:
+            page_params = self._page_params(params, k, page_size, offset)
+            return asyncio.ensure_future(
+                self._async_get(client, url, params=page_params, sem=sem)
+            )
+
+        k = 0
+        task = fetch(k)
+        try:
+            while task is not None:
+                response = await task
+                response.raise_for_status()
+                page = orjson.loads(response.content)
+
+                # A partial page is the last page
+                task = None
+                if len(page) == page_size:
+                    k += 1
+                    task = fetch(k)
+                yield page
+        finally:
+            if task is not None:
+                task.cancel()
+
+    def _get_all_pages(self, url: str, params: dict = None,
+                       page_size: int = 1000, offset: bool = False) -> list:
+        """
+        Retrieve all records of a paginated endpoint sequentially through
+        the persistent session
+
+        :param url: URL for HTTPS API
+        :param params: Query parameters for the request
+        :param page_size: Number of records per page
+        :param offset: Use ``offset``/``limit`` instead of
+                       ``page``/``page_size`` pagination
+
+        :return: JSON content of all pages
+        """
+
+        records = []
+        k = 0
+        while True:
+            page_params = self._page_params(params, k, page_size, offset)
+            page = self._request('GET', url, params=page_params)
+            records += page
+
+            # A partial page is the last page
+            if len(page) < page_size:
+                return records
+            k += 1
+
     def get_articles(self, process: bool = True) -> \
             Union[pd.DataFrame, Response]:
         """
@@ -77,8 +461,9 @@ class FigshareInstituteAdmin:
 
         See: https://docs.figshare.com/#private_institution_articles
 
-        :param process: Returns JSON content from ``redata_request``, otherwise
-                        the full request is provided. Default: True
+        :param process: Returns JSON content of all pages, otherwise
+                        the full request for the first page is provided.
+                        Default: True
 
         :return: Relational database of all articles for an institution or
                  the full ``requests.Response``
@@ -86,18 +471,51 @@ class FigshareInstituteAdmin:
 
         url = self.endpoint("articles")
 
-        # Figshare API is limited to a maximum of 1000 per page
-        # Full pagination still needed
-        params = {'page': 1, 'page_size': 1000}
-        articles = redata_request('GET', url, self.headers, params=params,
-                                  process=process)
+        if process:
+            articles = self._get_all_pages(url)
+        else:
+            # Figshare API is limited to a maximum of 1000 per page
+            params = {'page': 1, 'page_size': 1000}
+            articles = self._request('GET', url, params=params,
+                                     process=process)
 
         if process:
-            articles_df = pd.DataFrame(articles)
+            articles_df = _to_dataframe(articles)
             return articles_df
         else:
             return articles
 
+    def _get_user_list_json(self, account_id: int, kind: str,
+                            process: bool = True) -> Union[list, Response]:
+        """
+        Impersonate a user, ``account_id``, to retrieve the JSON content of
+        their articles, projects, or collections without building a DataFrame
+
+        :param account_id: Figshare *institute* account ID
+        :param kind: Type of records. Options are:
+               ['articles', 'projects', 'collections']
+        :param process: Returns JSON content of all pages, otherwise
+                        the full request for the first page is provided.
+                        Default: True
+
+        :return: List of records owned by user or the full
+                 ``requests.Response``
+        """
+
+        kind_list = ['articles', 'projects', 'collections']
+        if kind not in kind_list:
+            raise ValueError(f"Incorrect kind input. Must be one of {kind_list}")
+
+        url = getattr(self, f"_url_{kind}_user")
+
+        params = {'impersonate': account_id}
+        if process:
+            return self._get_all_pages(url, params)
+        else:
+            # Figshare API is limited to a maximum of 1000 per page
+            params.update(page=1, page_size=1000)
+            return self._request('GET', url, params=params, process=process)
+
     def get_user_articles(self, account_id: int, process: bool = True) \
             -> Union[pd.DataFrame, Response]:
         """
@@ -107,22 +525,19 @@ class FigshareInstituteAdmin:
         See: https://docs.figshare.com/#private_articles_list
 
         :param account_id: Figshare *institute* account ID
-        :param process: Returns JSON content from ``redata_request``, otherwise
-                        the full request is provided. Default: True
+        :param process: Returns JSON content of all pages, otherwise
+                        the full request for the first page is provided.
+                        Default: True
 
         :return: Relational database of all articles owned by user or
                  the full ``requests.Response``
         """
 
-        url = self.endpoint("articles", institute=False)
-
-        # Figshare API is limited to a maximum of 1000 per page
-        params = {'page': 1, 'page_size': 1000, 'impersonate': account_id}
-        user_articles = redata_request('GET', url, self.headers,
-                                       params=params, process=process)
+        user_articles = self._get_user_list_json(account_id, 'articles',
+                                                 process=process)
 
         if process:
-            user_articles_df = pd.DataFrame(user_articles)
+            user_articles_df = _to_dataframe(user_articles)
             return user_articles_df
         else:
             return user_articles
@@ -136,22 +551,19 @@ class FigshareInstituteAdmin:
         See: https://docs.figshare.com/#private_projects_list
 
         :param account_id: Figshare *institute* account ID
-        :param process: Returns JSON content from ``redata_request``, otherwise
-                        the full request is provided. Default: True
+        :param process: Returns JSON content of all pages, otherwise
+                        the full request for the first page is provided.
+                        Default: True
 
         :return: Relational database of all projects owned by user or
                  the full ``requests.Response``
         """
 
-        url = self.endpoint("projects", institute=False)
-
-        # Figshare API is limited to a maximum of 1000 per page
-        params = {'page': 1, 'page_size': 1000, 'impersonate': account_id}
-        user_projects = redata_request('GET', url, self.headers,
-                                       params=params, process=process)
+        user_projects = self._get_user_list_json(account_id, 'projects',
+                                                 process=process)
 
         if process:
-            user_projects_df = pd.DataFrame(user_projects)
+            user_projects_df = _to_dataframe(user_projects)
             return user_projects_df
         else:
             return user_projects
@@ -165,22 +577,19 @@ class FigshareInstituteAdmin:
         See: https://docs.figshare.com/#private_collections_list
 
         :param account_id: Figshare *institute* account ID
-        :param process: Returns JSON content from ``redata_request``, otherwise
-                        the full request is provided. Default: True
+        :param process: Returns JSON content of all pages, otherwise
+                        the full request for the first page is provided.
+                        Default: True
 
         :return: Relational database of all collections owned by user or
                  the full ``requests.Response``
         """
 
-        url = self.endpoint("collections", institute=False)
-
-        # Figshare API is limited to a maximum of 1000 per page
-        params = {'page': 1, 'page_size': 1000, 'impersonate': account_id}
-        user_collections = redata_request('GET', url, self.headers,
-                                          params=params, process=process)
+        user_collections = self._get_user_list_json(account_id, 'collections',
+                                                    process=process)
 
         if process:
-            user_collections_df = pd.DataFrame(user_collections)
+            user_collections_df = _to_dataframe(user_collections)
             return user_collections_df
         else:
             return user_collections
@@ -192,7 +601,9 @@ class FigshareInstituteAdmin:
 
         See: https://docs.figshare.com/#private_institution_groups_list
 
-        :param process: Returns JSON content from ``redata_request``, otherwise
+        Results are cached for ``cache_ttl`` seconds when ``process=True``
+
+        :param process: Returns JSON content from ``_request``, otherwise
                         the full request is provided. Default: True
 
         :return: Relational database of all Figshare groups for an institution
@@ -200,10 +611,13 @@ class FigshareInstituteAdmin:
         """
 
         url = self.endpoint("groups")
-        groups = redata_request('GET', url, self.headers, process=process)
+        if process:
+            groups = self._cached_request('groups', url)
+        else:
+            groups = self._request('GET', url, process=process)
 
         if process:
-            groups_df = pd.DataFrame(groups)
+            groups_df = _to_dataframe(groups)
             return groups_df
         else:
             return groups
@@ -215,8 +629,11 @@ class FigshareInstituteAdmin:
 
         See: https://docs.figshare.com/#private_institution_accounts_list
 
-        :param process: Returns JSON content from ``redata_request``, otherwise
-                        the full request is provided. Default: True
+        Results are cached for ``cache_ttl`` seconds when ``process=True``
+
+        :param process: Returns JSON content of all pages, otherwise
+                        the full request for the first page is provided.
+                        Default: True
 
         :return: Relational database of all user accounts for an institution
                  or the full ``requests.Response``
@@ -226,22 +643,27 @@ class FigshareInstituteAdmin:
 
         # Figshare API is limited to a maximum of 1000 per page
         params = {'page': 1, 'page_size': 1000}
-        accounts = redata_request('GET', url, self.headers,
-                                  params=params, process=process)
+        if process:
+            accounts = self._cached_request('accounts', url, paginate=True)
+        else:
+            accounts = self._request('GET', url, params=params,
+                                     process=process)
 
         if process:
-            accounts_df = pd.DataFrame(accounts)
+            accounts_df = _to_dataframe(accounts)
             accounts_df = accounts_df.drop(columns='institution_id')
 
             if self.ignore_admin:
                 self.log.info("Excluding administrative and test accounts")
 
-                drop_index = []
-                for ia in self.admin_filter:
-                    drop_index += list(accounts_df[accounts_df['email'].str.contains(ia)].index)
-
-                if len(drop_index) > 0:
-                    accounts_df = accounts_df.drop(drop_index).reset_index(drop=True)
+                if self._admin_patterns:
+                    # Object dtype so filters use Python re, not pyarrow
+                    emails = accounts_df['email'].astype(object)
+                    mask = np.zeros(len(emails), dtype=bool)
+                    for pattern in self._admin_patterns:
+                        mask |= emails.str.contains(pattern, na=False).values
+                    accounts_df = \
+                        accounts_df.loc[~mask].reset_index(drop=True)
             return accounts_df
         else:
             return accounts
@@ -254,25 +676,29 @@ class FigshareInstituteAdmin:
         See: https://docs.figshare.com/#private_institution_account_group_roles
 
         :param account_id: Figshare *institute* account ID
-        :param process: Returns JSON content from ``redata_request``, otherwise
+        :param process: Returns JSON content from ``_request``, otherwise
                         the full request is provided. Default: True
 
         :return: Python dictionary of all group roles for a user or
                  the full ``requests.Response``
         """
 
-        url = self.endpoint(f"roles/{account_id}")
+        url = self._url_roles + str(account_id)
 
-        roles = redata_request('GET', url, self.headers, process=process)
+        roles = self._request('GET', url, process=process)
         return roles
 
-    def get_account_details(self, flag: bool = True) -> pd.DataFrame:
+    def get_account_details(self, flag: bool = True,
+                            threaded: bool = False) -> pd.DataFrame:
         """
         Retrieve account details. This includes group association, number of
         articles, projects, and collections, and administrative and reviewer
         role flags
 
         :param flag: Populate administrative and reviewer roles to database
+        :param threaded: Retrieve account details with a thread pool instead
+                         of ``asyncio``. Always used within a running event
+                         loop. Default: False
 
         :return: Relational database of details of all accounts for an institution
         """
@@ -285,80 +711,307 @@ class FigshareInstituteAdmin:
         # Retrieve groups
         groups_df = self.get_groups()
 
-        num_articles = np.zeros(n_accounts, dtype=np.intc)
-        num_projects = np.zeros(n_accounts, dtype=np.intc)
-        num_collections = np.zeros(n_accounts, dtype=np.intc)
+        # Preallocate typed columns. Counts are nullable to distinguish
+        # failed retrievals from accounts without items
+        count_cols = ['Articles', 'Projects', 'Collections']
+        for col in count_cols:
+            accounts_df[col] = pd.array(np.zeros(n_accounts, dtype='int32'),
+                                        dtype='Int32')
 
-        orcid_num = [''] * n_accounts
-        user_id = np.zeros(n_accounts, dtype=np.intc)  # This is the Figshare user ID
+        accounts_df['ORCID'] = pd.array([''] * n_accounts, dtype='string')
+        # This is the Figshare user ID
+        accounts_df['user_id'] = pd.array(np.zeros(n_accounts, dtype='int32'),
+                                          dtype='Int32')
 
         if flag:
-            admin_flag = [''] * n_accounts
-            reviewer_flag = [''] * n_accounts
-        group_assoc = ['N/A'] * n_accounts
+            accounts_df['Admin'] = pd.array([''] * n_accounts, dtype='string')
+            accounts_df['Reviewer'] = \
+                pd.array([''] * n_accounts, dtype='string')
+        accounts_df['Group'] = pd.array(['N/A'] * n_accounts, dtype='string')
+
+        all_roles = [{}] * n_accounts
+
+        # Convert to Python int in one pass rather than boxing per element
+        account_ids = accounts_df['id'].to_numpy().tolist()
+
+        # Retrieve details for all accounts concurrently
+        if threaded or self._in_event_loop():
+            responses = self._get_account_details_threaded(account_ids)
+        else:
+            responses = asyncio.run(
+                self._get_account_details_async(account_ids)
+            )
 
         # Determine group roles for each account
-        for n, account_id in zip(range(n_accounts), accounts_df['id']):
+        for n, account_id in enumerate(account_ids):
+            other_resp, roles_resp, articles_resp, projects_resp, \
+                collections_resp = responses[n]
+
             # Save ORCID and account ID
-            other_account_dict = self.get_other_account_details(account_id)
-            orcid_num[n] = other_account_dict['orcid_id']
-            user_id[n] = other_account_dict['id']
+            other_account_dict = self._parse_response(other_resp)
+            accounts_df.at[n, 'ORCID'] = other_account_dict['orcid_id']
+            accounts_df.at[n, 'user_id'] = other_account_dict['id']
+
+            if articles_resp is None:
+                self.log.warning(
+                    f"Unable to retrieve roles for : {account_id}. Skipping..."
+                )
+                accounts_df.loc[n, count_cols] = pd.NA
+                continue
 
-            roles = self.get_account_group_roles(account_id)
+            all_roles[n] = self._parse_response(roles_resp)
 
             try:
-                articles_df = self.get_user_articles(account_id)
-                num_articles[n] = articles_df.shape[0]
-            except HTTPError:
+                accounts_df.at[n, 'Articles'] = \
+                    len(self._parse_response(articles_resp))
+            except requests.RequestException:
                 self.log.warning(
                     f"Unable to retrieve articles for : {account_id}"
                 )
+                accounts_df.at[n, 'Articles'] = pd.NA
 
             try:
-                projects_df = self.get_user_projects(account_id)
-                num_projects[n] = projects_df.shape[0]
-            except HTTPError:
+                accounts_df.at[n, 'Projects'] = \
+                    len(self._parse_response(projects_resp))
+            except requests.RequestException:
                 self.log.warning(
                     f"Unable to retrieve projects for : {account_id}"
                 )
+                accounts_df.at[n, 'Projects'] = pd.NA
 
             try:
-                collections_df = self.get_user_collections(account_id)
-                num_collections[n] = collections_df.shape[0]
-            except HTTPError:
+                accounts_df.at[n, 'Collections'] = \
+                    len(self._parse_response(collections_resp))
+            except requests.RequestException:
                 self.log.warning(
                     f"Unable to retrieve collections for : {account_id}"
                 )
-
-            for key in roles.keys():
-                for t_dict in roles[key]:
-                    if t_dict['id'] == 11:
-                        group_assoc[n] = key
-                    if flag:
-                        if t_dict['id'] == 2:
-                            admin_flag[n] = 'X'
-                        if t_dict['id'] == 49:
-                            reviewer_flag[n] = 'X'
-
-        accounts_df['Articles'] = num_articles
-        accounts_df['Projects'] = num_projects
-        accounts_df['Collections'] = num_collections
-
-        accounts_df['ORCID'] = orcid_num
-        accounts_df['user_id'] = user_id
+                accounts_df.at[n, 'Collections'] = pd.NA
+
+        # Decode group roles in long form: one row per (account, group, role)
+        role_rows = np.array(
+            [(n, t_dict['id'], key)
+             for n, roles in enumerate(all_roles)
+             for key, t_list in roles.items()
+             for t_dict in t_list],
+            dtype=[('n', 'i4'), ('rid', 'i4'), ('key', 'O')]
+        )
+        role_rows = role_rows[np.isin(role_rows['rid'],
+                                      [self.ROLE_GROUP, self.ROLE_ADMIN,
+                                       self.ROLE_REVIEWER])]
 
         if flag:
-            accounts_df['Admin'] = admin_flag
-            accounts_df['Reviewer'] = reviewer_flag
+            admin_n = role_rows['n'][role_rows['rid'] == self.ROLE_ADMIN]
+            reviewer_n = role_rows['n'][role_rows['rid'] == self.ROLE_REVIEWER]
+            accounts_df.loc[admin_n, 'Admin'] = 'X'
+            accounts_df.loc[reviewer_n, 'Reviewer'] = 'X'
 
         for group_id, group_name in zip(groups_df['id'], groups_df['name']):
             self.log.info(f"{group_id} - {group_name}")
-            group_assoc = [sub.replace(str(group_id), group_name) for
-                           sub in group_assoc]
 
-        accounts_df['Group'] = group_assoc
+        # Last group with ROLE_GROUP is the group association
+        group_rows = role_rows[role_rows['rid'] == self.ROLE_GROUP][::-1]
+        _, first_idx = np.unique(group_rows['n'], return_index=True)
+        group_rows = group_rows[first_idx]
+
+        id_to_name = dict(zip(groups_df['id'].astype(str), groups_df['name']))
+        accounts_df.loc[group_rows['n'], 'Group'] = \
+            [id_to_name.get(key, key) for key in group_rows['key']]
         return accounts_df
 
+    def _async_client(self) -> httpx.AsyncClient:
+        """Create an HTTP/2 ``httpx.AsyncClient`` for concurrent requests
+
+        :return: Asynchronous client with pooled connections
+        """
+
+        limits = httpx.Limits(max_connections=20,
+                              max_keepalive_connections=20)
+
+        # No timeout, consistent with requests through the session
+        return httpx.AsyncClient(http2=True, limits=limits,
+                                 headers=self.headers, timeout=None)
+
+    @staticmethod
+    def _parse_response(
+            response: Union[httpx.Response, Response, dict, list, Exception]) \
+            -> Union[dict, list]:
+        """
+        Return JSON content of a response gathered by ``asyncio.gather`` or
+        a thread pool
+
+        ``httpx`` exceptions are re-raised as the equivalent ``requests``
+        exception, so callers only need to handle
+        ``requests.exceptions.RequestException`` (e.g., ``HTTPError``)
+
+        :param response: ``httpx.Response``, ``requests.Response``, JSON
+                         content, or the exception raised
+
+        :return: JSON content
+        """
+
+        try:
+            if isinstance(response, Exception):
+                raise response
+            if isinstance(response, (httpx.Response, Response)):
+                response.raise_for_status()
+                return orjson.loads(response.content)
+            return response
+        except httpx.HTTPStatusError as err:
+            raise requests.HTTPError(str(err), response=err.response) from err
+        except httpx.TimeoutException as err:
+            raise requests.Timeout(str(err)) from err
+        except httpx.TransportError as err:
+            raise requests.ConnectionError(str(err)) from err
+        except httpx.HTTPError as err:
+            raise requests.RequestException(str(err)) from err
+
+    def _is_inaccessible(self, response) -> bool:
+        """
+        Check whether a group roles response, or the exception raised,
+        indicates an account that should be skipped
+
+        :param response: HTTP response or the exception raised
+
+        :return: True if the status code is in ``skip_status``
+        """
+
+        if isinstance(response, (httpx.HTTPStatusError, requests.HTTPError)):
+            response = response.response
+        return getattr(response, 'status_code', None) in self.skip_status
+
+    @staticmethod
+    def _in_event_loop() -> bool:
+        """Check whether an event loop is running, so ``asyncio.run`` fails"""
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    @staticmethod
+    def _thread_map(callables: List[Callable], max_workers: int = 16) \
+            -> list:
+        """
+        Call each of ``callables`` in a thread pool
+
+        :param callables: Functions without arguments
+        :param max_workers: Maximum number of threads
+
+        :return: Result (or the ``requests`` exception raised) of each call
+        """
+
+        def call(func: Callable):
+            try:
+                return func()
+            except requests.RequestException as err:
+                return err
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(call, callables))
+
+    async def _get_account_details_async(self, account_ids: List[int]) \
+            -> List[list]:
+        """
+        Concurrently retrieve the user details, group roles, articles,
+        projects, and collections for each account in ``account_ids``
+
+        :param account_ids: List of Figshare *institute* account IDs
+
+        :return: For each account, a list of ``httpx.Response`` for the user
+                 details and group roles, JSON content of all pages for the
+                 articles, projects, and collections (or the exception
+                 raised) in the above order. Articles, projects, and
+                 collections are None if the group roles response status
+                 is in ``skip_status``
+        """
+
+        # Limit concurrency per host to respect Figshare rate limits
+        sem = asyncio.Semaphore(10)
+
+        async with self._async_client() as client:
+            def fetcher(url: str, impersonate: bool = False):
+                async def fetch(aid: int) -> Union[httpx.Response, list]:
+                    if impersonate:
+                        params = {'impersonate': aid}
+                        return [record async for page in
+                                self._paginate(url, params, client=client,
+                                               sem=sem)
+                                for record in page]
+                    else:
+                        return await self._async_get(client, url + str(aid),
+                                                     sem=sem)
+                return fetch
+
+            users_loader = _BatchLoader(fetcher(self._url_users))
+            roles_loader = _BatchLoader(fetcher(self._url_roles))
+            list_loaders = [
+                _BatchLoader(fetcher(url, impersonate=True))
+                for url in [self._url_articles_user, self._url_projects_user,
+                            self._url_collections_user]
+            ]
+
+            async def fetch_account(aid: int) -> list:
+                other_resp, roles_resp = await asyncio.gather(
+                    users_loader.load(aid), roles_loader.load(aid),
+                    return_exceptions=True
+                )
+
+                # Do not request items for inaccessible accounts
+                if self._is_inaccessible(roles_resp):
+                    return [other_resp, roles_resp, None, None, None]
+
+                list_resp = await asyncio.gather(
+                    *[loader.load(aid) for loader in list_loaders],
+                    return_exceptions=True
+                )
+                return [other_resp, roles_resp] + list_resp
+
+            return await asyncio.gather(
+                *[fetch_account(aid) for aid in account_ids]
+            )
+
+    def _get_account_details_threaded(self, account_ids: List[int]) \
+            -> List[list]:
+        """
+        Thread pool alternative to ``_get_account_details_async`` for
+        when ``asyncio.run`` cannot be used (e.g., in a running event loop)
+
+        :param account_ids: List of Figshare *institute* account IDs
+
+        :return: Same as ``_get_account_details_async`` with JSON content
+                 (or the ``requests`` exception raised)
+        """
+
+        def get(url: str) -> Callable:
+            return lambda: self._request('GET', url)
+
+        def get_list(aid: int, kind: str) -> Callable:
+            return lambda: self._get_user_list_json(aid, kind)
+
+        user_roles = self._thread_map(
+            [get(url + str(aid)) for aid in account_ids
+             for url in [self._url_users, self._url_roles]]
+        )
+
+        kinds = ['articles', 'projects', 'collections']
+        accessible = [aid for n, aid in enumerate(account_ids)
+                      if not self._is_inaccessible(user_roles[2 * n + 1])]
+        lists = iter(self._thread_map(
+            [get_list(aid, kind) for aid in accessible for kind in kinds]
+        ))
+
+        responses = []
+        for n, aid in enumerate(account_ids):
+            account_resp = user_roles[2 * n: 2 * n + 2]
+            if self._is_inaccessible(account_resp[1]):
+                account_resp += [None, None, None]
+            else:
+                account_resp += [next(lists) for _ in kinds]
+            responses.append(account_resp)
+        return responses
+
     def get_other_account_details(self, account_id: int) -> dict:
         """
         Retrieve ORCID and Figshare account information (among other metadata)
@@ -370,9 +1023,9 @@ class FigshareInstituteAdmin:
         :return: Dictionary with full account details
         """
 
-        url = self.endpoint(f"users/{account_id}", institute=True)
+        url = self._url_users + str(account_id)
 
-        other_account_dict = redata_request('GET', url, self.headers)
+        other_account_dict = self._request('GET', url)
 
         return other_account_dict
 
@@ -388,8 +1041,9 @@ class FigshareInstituteAdmin:
         :param article_id: Figshare article ID
         :param status: Filter by status of review. Options are:
                ['', 'pending', 'approved', 'rejected', 'closed']
-        :param process: Returns JSON content from ``redata_request``, otherwise
-                        the full request is provided. Default: True
+        :param process: Returns JSON content of all pages, otherwise
+                        the full request for the first page is provided.
+                        Default: True
 
         :return: Relational database of all curation records or
                  the full ``requests.Response``
@@ -400,18 +1054,22 @@ class FigshareInstituteAdmin:
 
         url = self.endpoint("reviews")
 
-        params = {'offset': 0, 'limit': 1000}
+        params = {}
         if article_id is not None:
             params['article_id'] = article_id
 
         if status:
             params['status'] = status
 
-        curation_list = redata_request('GET', url, self.headers,
-                                       params=params, process=process)
+        if process:
+            curation_list = self._get_all_pages(url, params, offset=True)
+        else:
+            params.update(offset=0, limit=1000)
+            curation_list = self._request('GET', url, params=params,
+                                          process=process)
 
         if process:
-            curation_df = pd.DataFrame(curation_list)
+            curation_df = _to_dataframe(curation_list)
             return curation_df
         else:
             return curation_list
@@ -424,7 +1082,7 @@ class FigshareInstituteAdmin:
         See: https://docs.figshare.com/#account_institution_curation
 
         :param curation_id: Figshare curation ID
-        :param process: Returns JSON content from ``redata_request``, otherwise
+        :param process: Returns JSON content from ``_request``, otherwise
                         the full request is provided. Default: True
 
         :return: Python dictionary with curation metadata or
@@ -433,8 +1091,7 @@ class FigshareInstituteAdmin:
 
         url = self.endpoint(f"review/{curation_id}")
 
-        curation_details = redata_request('GET', url, self.headers,
-                                          process=process)
+        curation_details = self._request('GET', url, process=process)
         return curation_details
 
     def get_curation_comments(self, curation_id: int, process: bool = True) \
@@ -445,7 +1102,7 @@ class FigshareInstituteAdmin:
         See: https://docs.figshare.com/#account_institution_curation_comments
 
         :param curation_id: Figshare curation ID
-        :param process: Returns JSON content from ``redata_request``, otherwise
+        :param process: Returns JSON content from ``_request``, otherwise
                         the full request is provided. Default: True
 
         :return: Python dictionary with curation comments or
@@ -454,11 +1111,11 @@ class FigshareInstituteAdmin:
 
         url = self.endpoint(f"review/{curation_id}/comments")
 
-        curation_comments = redata_request('GET', url, self.headers,
-                                           process=process)
+        curation_comments = self._request('GET', url, process=process)
         return curation_comments
 
-    def doi_check(self, article_id: int, process: bool = True) -> \
+    def doi_check(self, article_id: int, process: bool = True,
+                  article_details: dict = None) -> \
             Union[Tuple[bool, str], Response]:
         """
         Check if DOI is present/reserved for ``article_id``.
@@ -466,16 +1123,19 @@ class FigshareInstituteAdmin:
         Uses: https://docs.figshare.com/#private_article_details
 
         :param article_id: Figshare article ID
-        :param process: Returns JSON content from ``redata_request``, otherwise
+        :param process: Returns JSON content from ``_request``, otherwise
                         the full request is provided. Default: True
+        :param article_details: Article details, if already retrieved.
+                                Skips the request when provided
 
         :return: Flag to indicate whether DOI is reserved and DOI (empty string if not).
                  Returns the full ``requests.Response`` if ``process=False``
         """
-        url = self.endpoint(f"articles/{article_id}", institute=False)
 
-        article_details = redata_request('GET', url, self.headers,
-                                         process=process)
+        if article_details is None or not process:
+            url = self.endpoint(f"articles/{article_id}", institute=False)
+
+            article_details = self._request('GET', url, process=process)
 
         if process:
             check = False
@@ -486,11 +1146,9 @@ class FigshareInstituteAdmin:
         else:
             return article_details
 
-    def reserve_doi(self, article_id: int) -> str:
+    def _post_reserve_doi(self, article_id: int) -> str:
         """
-        Reserve DOI if one has not been reserved for ``article_id``.
-
-        See: https://docs.figshare.com/#private_article_reserve_doi
+        Reserve DOI for ``article_id`` without any checks
 
         :param article_id: Figshare article ID
 
@@ -500,8 +1158,28 @@ class FigshareInstituteAdmin:
         url = self.endpoint(f"articles/{article_id}/reserve_doi",
                             institute=False)
 
+        self.log.info(f"Reserving DOI for {article_id} ... ")
+        response = self._request('POST', url)
+        self.log.info(f"DOI minted : {response['doi']}")
+        return response['doi']
+
+    def reserve_doi(self, article_id: int, article_details: dict = None) \
+            -> str:
+        """
+        Reserve DOI if one has not been reserved for ``article_id``.
+
+        See: https://docs.figshare.com/#private_article_reserve_doi
+
+        :param article_id: Figshare article ID
+        :param article_details: Article details, if already retrieved.
+                                Skips the DOI check request when provided
+
+        :return: DOI string
+        """
+
         # Check if DOI has been reserved
-        doi_check, doi_string = self.doi_check(article_id)
+        doi_check, doi_string = \
+            self.doi_check(article_id, article_details=article_details)
 
         if doi_check:
             self.log.info("DOI already reserved! Skipping... ")
@@ -515,10 +1193,91 @@ class FigshareInstituteAdmin:
             )
             self.log.info(f"RESPONSE: {src_input}")
             if src_input.lower() == 'yes':
-                self.log.info("Reserving DOI ... ")
-                response = redata_request('POST', url, self.headers)
-                self.log.info(f"DOI minted : {response['doi']}")
-                return response['doi']
+                return self._post_reserve_doi(article_id)
             else:
                 self.log.warning("Skipping... ")
                 return doi_string
+
+    async def _get_article_details_async(self, article_ids: List[int]) \
+            -> List[Union[httpx.Response, Exception]]:
+        """
+        Concurrently retrieve article details for each of ``article_ids``
+
+        :param article_ids: List of Figshare article IDs
+
+        :return: ``httpx.Response`` (or the exception raised) for each article
+        """
+
+        # Limit concurrency per host to respect Figshare rate limits
+        sem = asyncio.Semaphore(10)
+
+        async with self._async_client() as client:
+            async def fetch(article_id: int) -> httpx.Response:
+                url = self.endpoint(f"articles/{article_id}",
+                                    institute=False)
+                return await self._async_get(client, url, sem=sem)
+
+            return await asyncio.gather(
+                *[fetch(article_id) for article_id in article_ids],
+                return_exceptions=True
+            )
+
+    def reserve_dois(self, article_ids: List[int]) -> dict:
+        """
+        Reserve DOIs for all ``article_ids`` that do not have one reserved.
+        Article details are retrieved concurrently, and a single prompt is
+        provided before reserving
+
+        See: https://docs.figshare.com/#private_article_reserve_doi
+
+        :param article_ids: List of Figshare article IDs
+
+        :return: Dictionary of DOI string for each article ID. Articles with
+                 details that could not be retrieved are excluded
+        """
+
+        # Remove duplicates to avoid reserving twice
+        article_ids = list(dict.fromkeys(article_ids))
+
+        if self._in_event_loop():
+            responses = self._thread_map(
+                [lambda aid=aid: self.doi_check(aid, process=False)
+                 for aid in article_ids]
+            )
+        else:
+            responses = asyncio.run(
+                self._get_article_details_async(article_ids)
+            )
+
+        dois = {}
+        no_doi = []
+        for article_id, response in zip(article_ids, responses):
+            try:
+                article_details = self._parse_response(response)
+            except requests.RequestException:
+                self.log.warning(
+                    f"Unable to retrieve article details for : {article_id}"
+                )
+                continue
+            dois[article_id] = article_details['doi']
+            if not article_details['doi']:
+                no_doi.append(article_id)
+
+        if not no_doi:
+            self.log.info("DOIs already reserved! Skipping... ")
+            return dois
+
+        self.log.info(
+            f"PROMPT: DOI reservation has not occurred for {len(no_doi)} "
+            f"articles: {no_doi}. Do you wish to reserve?"
+        )
+        src_input = input(
+            "PROMPT: Type 'Yes'/'yes'. Anything else will skip : "
+        )
+        self.log.info(f"RESPONSE: {src_input}")
+        if src_input.lower() == 'yes':
+            for article_id in no_doi:
+                dois[article_id] = self._post_reserve_doi(article_id)
+        else:
+            self.log.warning("Skipping... ")
+        return dois